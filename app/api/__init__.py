@@ -4,10 +4,13 @@ Paksa AI Assistant - API Router
 This module contains the main API router and endpoint definitions.
 Copyright © 2025 Paksa IT Solutions (www.paksa.com.pk)
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
+from fastapi_cache import FastAPICache
+from fastapi_cache.decorator import cache
 from typing import List, Optional
 import logging
+import orjson
 
 from app.models.user import User, UserInDB, UserCreate, Token, TokenData
 from app.services.auth import (
@@ -16,7 +19,7 @@ from app.services.auth import (
     create_access_token,
     get_password_hash,
 )
-from app.core.license import validate_license
+from app.core.license import LicenseManager, get_license_manager
 
 logger = logging.getLogger(__name__)
 
@@ -29,14 +32,24 @@ router = APIRouter(
 # OAuth2 scheme
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"api/v1/auth/token")
 
+# Cache namespace for license validation responses
+LICENSE_CACHE_NAMESPACE = "license"
+
+async def clear_license_cache():
+    """Invalidate cached license validation responses"""
+    await FastAPICache.clear(namespace=LICENSE_CACHE_NAMESPACE)
+
+# Static root payload, serialized once at import
+_ROOT_BYTES = orjson.dumps({
+    "message": "Welcome to Paksa AI Assistant API",
+    "version": "1.0.0",
+    "documentation": "/docs"
+})
+
 @router.get("/")
 async def read_root():
     """Root endpoint"""
-    return {
-        "message": "Welcome to Paksa AI Assistant API",
-        "version": "1.0.0",
-        "documentation": "/docs"
-    }
+    return Response(content=_ROOT_BYTES, media_type="application/json")
 
 @router.post("/auth/token", response_model=Token)
 async def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends()):
@@ -66,9 +79,12 @@ async def create_user(user: UserCreate):
     pass
 
 @router.get("/license/validate")
-async def validate_license_endpoint():
+@cache(expire=60, namespace=LICENSE_CACHE_NAMESPACE)
+async def validate_license_endpoint(
+    license_manager: LicenseManager = Depends(get_license_manager),
+):
     """Validate the current license"""
-    is_valid, message = validate_license()
+    is_valid, message = license_manager.check_license()
     if not is_valid:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -5,6 +5,7 @@ Provides hardware-based identification for license binding.
 Copyright © 2025 Paksa IT Solutions (www.paksa.com.pk)
 """
 import platform
+import asyncio
 import hashlib
 import uuid
 import subprocess
@@ -12,25 +13,62 @@ import re
 import os
 import sys
 import socket
-import psutil
+import orjson
+from functools import lru_cache
 from typing import Dict, Any, Optional
 
+# Matches a MAC address in raw command output
+_MAC_RE = re.compile(rb'([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})')
+
+def sha256_hex(payload: bytes) -> str:
+    """Hash a fully assembled payload in a single SHA-256 call"""
+    return hashlib.sha256(payload).digest().hex()
+
+def _get_psutil_mac_address() -> Optional[str]:
+    """Get the MAC address of the primary network interface using psutil"""
+    import psutil
+    
+    stats = psutil.net_if_stats()
+    addrs = psutil.net_if_addrs()
+    
+    # Prefer interfaces that are up, then the fastest link
+    interfaces = sorted(
+        stats.items(),
+        key=lambda item: (item[1].isup, item[1].speed),
+        reverse=True,
+    )
+    for name, stat in interfaces:
+        if not stat.isup:
+            continue
+        for addr in addrs.get(name, []):
+            if addr.family == psutil.AF_LINK and addr.address:
+                mac = addr.address.replace('-', ':').lower()
+                if mac != '00:00:00:00:00:00':
+                    return mac
+    return None
+
+@lru_cache(maxsize=None)
 def get_mac_address() -> str:
     """Get the MAC address of the primary network interface"""
+    try:
+        mac = _get_psutil_mac_address()
+        if mac:
+            return mac
+    except Exception:
+        pass
+    
     try:
         # Get the MAC address of the default gateway interface
         if sys.platform == 'win32':
             # Windows
-            result = subprocess.check_output(['getmac']).decode('utf-8')
-            mac = re.search(r'([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})', result)
+            mac = _MAC_RE.search(subprocess.check_output(['getmac']))
             if mac:
-                return mac.group(0).replace('-', ':')
+                return mac.group(0).decode('ascii').replace('-', ':')
         else:
             # Linux/Mac
-            result = subprocess.check_output(['ifconfig']).decode('utf-8')
-            mac = re.search(r'([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})', result)
+            mac = _MAC_RE.search(subprocess.check_output(['ifconfig']))
             if mac:
-                return mac.group(0)
+                return mac.group(0).decode('ascii')
     except Exception:
         pass
     
@@ -38,6 +76,7 @@ def get_mac_address() -> str:
     return ':'.join(['{:02x}'.format((uuid.getnode() >> elements) & 0xff) 
                     for elements in range(5, -1, -1)])
 
+@lru_cache(maxsize=None)
 def get_cpu_id() -> str:
     """Get a unique identifier for the CPU"""
     try:
@@ -62,8 +101,36 @@ def get_cpu_id() -> str:
     
     # Fallback to a hash of the CPU info
     cpu_info = str(platform.processor()) + str(os.cpu_count())
-    return hashlib.sha256(cpu_info.encode()).hexdigest()
+    return sha256_hex(cpu_info.encode())
+
+def _get_sysfs_disk_serial() -> Optional[str]:
+    """Read the serial of the disk backing the root partition from sysfs (Linux)"""
+    import psutil
+    
+    root = next(
+        (part for part in psutil.disk_partitions() if part.mountpoint == '/'),
+        None,
+    )
+    if not root or not root.device.startswith('/dev/'):
+        return None
+    
+    # Resolve the partition (e.g. sda1, nvme0n1p2) to its parent disk
+    block = os.path.realpath(
+        os.path.join('/sys/class/block', os.path.basename(root.device))
+    )
+    if os.path.exists(os.path.join(block, 'partition')):
+        block = os.path.dirname(block)
+    
+    for name in ('serial', 'wwid'):
+        path = os.path.join(block, 'device', name)
+        if os.path.exists(path):
+            with open(path) as f:
+                serial = f.read().strip()
+            if serial:
+                return serial
+    return None
 
+@lru_cache(maxsize=None)
 def get_disk_serial() -> str:
     """Get the serial number of the primary disk"""
     try:
@@ -76,6 +143,15 @@ def get_disk_serial() -> str:
             serial = result.split('\n')[1].strip()
             return serial if serial else str(uuid.uuid4())
         else:
+            # Linux: read sysfs directly before falling back to lsblk
+            if sys.platform.startswith('linux'):
+                try:
+                    serial = _get_sysfs_disk_serial()
+                except (ImportError, OSError):
+                    serial = None
+                if serial:
+                    return serial
+            
             # Linux/Mac
             result = subprocess.check_output(
                 ['lsblk', '-d', '-o', 'SERIAL', '-n']
@@ -84,6 +160,23 @@ def get_disk_serial() -> str:
     except Exception:
         return str(uuid.uuid4())
 
+@lru_cache(maxsize=1)
+def _total_ram() -> int:
+    """Get the total physical memory in bytes"""
+    if sys.platform.startswith('linux'):
+        try:
+            with open('/proc/meminfo', 'rb') as f:
+                for line in f:
+                    if line.startswith(b'MemTotal:'):
+                        # Reported in kB, matching psutil's conversion
+                        return int(line.split()[1]) * 1024
+        except (OSError, ValueError, IndexError):
+            pass
+    
+    import psutil
+    return psutil.virtual_memory().total
+
+@lru_cache(maxsize=None)
 def get_system_info() -> Dict[str, Any]:
     """Get system information for hardware fingerprinting"""
     return {
@@ -95,7 +188,7 @@ def get_system_info() -> Dict[str, Any]:
         'machine': platform.machine(),
         'processor': platform.processor(),
         'cpu_count': os.cpu_count(),
-        'total_ram': psutil.virtual_memory().total,
+        'total_ram': _total_ram(),
         'mac_address': get_mac_address(),
         'cpu_id': get_cpu_id(),
         'disk_serial': get_disk_serial(),
@@ -103,6 +196,23 @@ def get_system_info() -> Dict[str, Any]:
         'fqdn': socket.getfqdn(),
     }
 
+async def get_system_info_async() -> Dict[str, Any]:
+    """
+    Get system information without blocking the event loop
+    
+    The MAC address, CPU ID and disk serial lookups may each spawn a
+    subprocess, so they are gathered concurrently in worker threads.
+    """
+    await asyncio.gather(
+        asyncio.to_thread(get_mac_address),
+        asyncio.to_thread(get_cpu_id),
+        asyncio.to_thread(get_disk_serial),
+    )
+    # The lookups above are now cached; build the rest off the loop as well
+    # since socket.getfqdn() may block on DNS
+    return await asyncio.to_thread(get_system_info)
+
+@lru_cache(maxsize=None)
 def get_hardware_id(use_system_info: bool = True) -> str:
     """
     Generate a unique hardware identifier for the current machine
@@ -112,17 +222,20 @@ def get_hardware_id(use_system_info: bool = True) -> str:
         
     Returns:
         A string representing the hardware ID
+
+    The result is cached for the lifetime of the process since the
+    underlying hardware does not change while the application is running.
     """
     if use_system_info:
         # Create a hash of the system information
         system_info = get_system_info()
-        info_str = json.dumps(system_info, sort_keys=True)
-        return hashlib.sha256(info_str.encode()).hexdigest()
+        info_bytes = orjson.dumps(
+            system_info, option=orjson.OPT_SORT_KEYS, default=str
+        )
+        return sha256_hex(info_bytes)
     else:
         # Simple hardware ID based on MAC address and disk serial
-        return hashlib.sha256(
-            f"{get_mac_address()}:{get_disk_serial()}".encode()
-        ).hexdigest()
+        return sha256_hex(f"{get_mac_address()}:{get_disk_serial()}".encode())
 
 def validate_hardware_id(hardware_id: str) -> bool:
     """
@@ -5,14 +5,16 @@ Handles software licensing and validation.
 Copyright © 2025 Paksa IT Solutions (www.paksa.com.pk)
 """
 import os
-import json
 import hashlib
+import hmac
+import orjson
 import uuid
 from datetime import datetime, timedelta
 from typing import Tuple, Optional, Dict, Any
 import logging
+from fastapi import Request
 
-from app.core.hardware import get_hardware_id
+from app.core.hardware import get_hardware_id, sha256_hex
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +30,10 @@ class LicenseManager:
         self.license_key = license_key or os.getenv("LICENSE_KEY")
         self.license_data = None
         
+        # Hardware identity is fixed for the process lifetime, compute it once.
+        # The hardware ID is already a SHA-256 digest, so use it directly.
+        self._hw_signature = get_hardware_id()
+        
         # Load license data if key is provided
         if self.license_key:
             self.license_data = self._validate_license(self.license_key)
@@ -35,12 +41,7 @@ class LicenseManager:
     def _generate_license_id(self, customer_name: str) -> str:
         """Generate a unique license ID"""
         seed = f"{customer_name}-{datetime.utcnow().isoformat()}-{uuid.uuid4()}"
-        return hashlib.sha256(seed.encode()).hexdigest()
-    
-    def _get_hardware_signature(self) -> str:
-        """Generate a hardware signature for the current machine"""
-        hardware_id = get_hardware_id()
-        return hashlib.sha256(hardware_id.encode()).hexdigest()
+        return sha256_hex(seed.encode())
     
     def generate_license(
         self,
@@ -83,7 +84,7 @@ class LicenseManager:
             "max_users": max_users,
             "features": features,
             "hardware_bound": True,
-            "hardware_signature": self._get_hardware_signature(),
+            "hardware_signature": self._hw_signature,
             "version": "1.0.0",
         }
         
@@ -98,14 +99,21 @@ class LicenseManager:
         data = license_data.copy()
         data.pop("signature", None)
         
-        # Convert to a consistent string representation
-        data_str = json.dumps(data, sort_keys=True)
+        # Convert to a consistent byte representation
+        payload = orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
         
-        # Generate a signature using SHA-256
+        # Generate a signature using HMAC-SHA256
         secret = os.getenv("LICENSE_SECRET", "your-secret-key-here")
-        signature = hashlib.sha256(f"{data_str}{secret}".encode()).hexdigest()
-        
-        return signature
+        return hmac.new(secret.encode(), payload, hashlib.sha256).hexdigest()
+    
+    def _verify_signature(self, license_data: Dict[str, Any]) -> bool:
+        """Verify the signature of the license data in constant time"""
+        provided = license_data.get("signature")
+        if not isinstance(provided, str):
+            return False
+        expected = self._sign_license(license_data)
+        # Compare bytes, since compare_digest rejects non-ASCII str input
+        return hmac.compare_digest(expected.encode(), provided.encode())
     
     def _validate_license(self, license_key: str) -> Dict[str, Any]:
         """
@@ -127,7 +135,8 @@ class LicenseManager:
                 raise LicenseError("Invalid license key format")
             
             # Here you would typically verify the license with your license server
-            # For demonstration, we'll just return a mock response
+            # and reject its response unless self._verify_signature() passes.
+            # For demonstration, we'll just return an unsigned mock response
             return {
                 "valid": True,
                 "message": "License is valid",
@@ -163,8 +172,10 @@ class LicenseManager:
                 
             # Check hardware binding if enabled
             if license_data.get("hardware_bound", False):
-                current_signature = self._get_hardware_signature()
-                if current_signature != license_data.get("hardware_signature"):
+                license_signature = license_data.get("hardware_signature")
+                if not isinstance(license_signature, str) or not hmac.compare_digest(
+                    self._hw_signature.encode(), license_signature.encode()
+                ):
                     return False, "License is not valid for this hardware"
             
             return True, "License is valid"
@@ -175,22 +186,33 @@ class LicenseManager:
             logger.error(f"Error checking license: {str(e)}")
             return False, f"Error checking license: {str(e)}"
 
-# Global license manager instance
-license_manager = LicenseManager()
+def get_license_manager(request: Request) -> LicenseManager:
+    """
+    Get the license manager created at application startup
+    
+    Intended for use as a FastAPI dependency.
+    """
+    return request.app.state.license_manager
 
-def validate_license() -> Tuple[bool, str]:
+def validate_license(license_manager: LicenseManager) -> Tuple[bool, str]:
     """
     Validate the current license
     
+    Args:
+        license_manager: The application's license manager
+        
     Returns:
         Tuple of (is_valid, message)
     """
     return license_manager.check_license()
 
-def get_license_features() -> dict:
+def get_license_features(license_manager: LicenseManager) -> dict:
     """
     Get the features enabled by the current license
     
+    Args:
+        license_manager: The application's license manager
+        
     Returns:
         Dictionary of features and their status
     """
@@ -198,15 +220,16 @@ def get_license_features() -> dict:
         return license_manager.license_data.get("features", {})
     return {}
 
-def is_feature_enabled(feature_name: str) -> bool:
+def is_feature_enabled(license_manager: LicenseManager, feature_name: str) -> bool:
     """
     Check if a specific feature is enabled by the current license
     
     Args:
+        license_manager: The application's license manager
         feature_name: Name of the feature to check
         
     Returns:
         True if the feature is enabled, False otherwise
     """
-    features = get_license_features()
+    features = get_license_features(license_manager)
     return features.get(feature_name, False)
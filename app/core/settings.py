@@ -0,0 +1,34 @@
+"""
+Paksa AI Assistant - Application Settings
+
+Parses environment configuration once at import into typed settings.
+Copyright © 2025 Paksa IT Solutions (www.paksa.com.pk)
+"""
+from typing import List, Union
+from pydantic import field_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+class Settings(BaseSettings):
+    """Application settings loaded from the environment and .env file"""
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore")
+    
+    app_env: str = "development"
+    # Union with str so non-JSON values reach the validator instead of failing
+    # JSON decoding in the settings source
+    cors_origins: Union[List[str], str] = ["*"]
+    api_prefix: str = "/api/v1"
+    log_level: str = "INFO"
+    workers: int = 1
+    
+    @field_validator('cors_origins', mode='before')
+    @classmethod
+    def parse_cors_origins(cls, v):
+        """Accept a JSON list or a comma-separated string of origins"""
+        if isinstance(v, str):
+            origins = [origin.strip() for origin in v.split(',') if origin.strip()]
+            # An empty value falls back to the default rather than disabling CORS
+            return origins or cls.model_fields['cors_origins'].default
+        return v
+
+# Global settings instance
+settings = Settings()
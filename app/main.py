@@ -4,21 +4,31 @@ Paksa AI Assistant - Main Application
 This is the entry point for the Paksa AI Assistant application.
 Copyright © 2025 Paksa IT Solutions (www.paksa.com.pk)
 """
-import os
+import asyncio
 import logging
-from fastapi import FastAPI, Request, HTTPException, Depends
+import time
+import orjson
+from typing import Dict
+from fastapi import FastAPI, Request, Response, HTTPException, Depends
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from contextlib import asynccontextmanager
 from dotenv import load_dotenv
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.inmemory import InMemoryBackend
+
+from app.core.hardware import get_system_info_async
+from app.core.license import LicenseManager
+from app.core.settings import settings
 
 # Load environment variables
 load_dotenv()
 
 # Configure logging
 logging.basicConfig(
-    level=os.getenv("LOG_LEVEL", "INFO"),
+    level=settings.log_level,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
 )
 logger = logging.getLogger(__name__)
@@ -29,10 +39,13 @@ async def lifespan(app: FastAPI):
     """Handle application startup and shutdown events"""
     # Startup
     logger.info("Starting Paksa AI Assistant...")
-    logger.info(f"Environment: {os.getenv('APP_ENV', 'development')}")
+    logger.info(f"Environment: {settings.app_env}")
+    
+    # Initialize response cache
+    FastAPICache.init(InMemoryBackend())
     
     # Initialize services
-    await initialize_services()
+    await initialize_services(app)
     
     yield
     
@@ -55,50 +68,104 @@ app = FastAPI(
         "url": "https://www.paksa.com.pk/license",
     },
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
+# Minimum seconds between full tracebacks logged for the same exception type
+TRACEBACK_LOG_INTERVAL = 1.0
+_last_traceback_logged: Dict[str, float] = {}
+
+class GlobalExceptionMiddleware:
+    """
+    Return a 500 response for uncaught exceptions without re-raising them
+    
+    Unlike an Exception handler, which Starlette re-raises to the server after
+    responding, this swallows the exception so the traceback is only formatted
+    when we choose to log it. Implemented as plain ASGI to avoid the per-request
+    overhead of BaseHTTPMiddleware.
+    """
+    
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        response_started = False
+        
+        async def send_wrapper(message: Message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as exc:
+            # A new response can't be sent once one has started; let the
+            # server close the connection
+            if response_started:
+                raise
+            
+            # Format the full traceback at most once per interval per exception type
+            key = type(exc).__name__
+            now = time.monotonic()
+            if now - _last_traceback_logged.get(key, 0.0) > TRACEBACK_LOG_INTERVAL:
+                _last_traceback_logged[key] = now
+                logger.error(f"Unhandled exception: {exc}", exc_info=True)
+            else:
+                logger.error(f"Unhandled exception: {key}: {exc} (traceback suppressed)")
+            response = ORJSONResponse(
+                status_code=500,
+                content={"detail": "Internal server error"},
+            )
+            await response(scope, receive, send)
+
+# Add global exception middleware before CORS so 500s keep their CORS headers
+app.add_middleware(GlobalExceptionMiddleware)
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=os.getenv("CORS_ORIGINS", ["*"]),
+    allow_origins=settings.cors_origins,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
-# Add global exception handler
-@app.exception_handler(Exception)
-async def global_exception_handler(request: Request, exc: Exception):
-    """Handle uncaught exceptions"""
-    logger.error(f"Unhandled exception: {exc}", exc_info=True)
-    return JSONResponse(
-        status_code=500,
-        content={"detail": "Internal server error"},
-    )
+# Static health payload, serialized once at import
+_HEALTH_BYTES = orjson.dumps({
+    "status": "ok",
+    "service": "Paksa AI Assistant",
+    "version": "1.0.0"
+})
 
 # Health check endpoint
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return {
-        "status": "ok",
-        "service": "Paksa AI Assistant",
-        "version": "1.0.0"
-    }
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
 
 # Import and include routers
 from app.api import router as api_router
-app.include_router(api_router, prefix=os.getenv("API_PREFIX", "/api/v1"))
+app.include_router(api_router, prefix=settings.api_prefix)
 
 # Mount static files (if any)
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
-async def initialize_services():
+async def initialize_services(app: FastAPI):
     """Initialize application services"""
     # Initialize database connection
     # Initialize cache
     # Initialize AI models
     logger.info("Initializing services...")
+    
+    # Gather the hardware fingerprint concurrently, then initialize the
+    # license manager off the event loop from the cached results
+    await get_system_info_async()
+    app.state.license_manager = await asyncio.to_thread(LicenseManager)
 
 async def shutdown_services():
     """Shutdown application services"""
@@ -107,11 +174,16 @@ async def shutdown_services():
     logger.info("Shutting down services...")
 
 if __name__ == "__main__":
+    import sys
     import uvicorn
     uvicorn.run(
         "app.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
-        log_level="info"
+        reload=settings.app_env != "production",
+        log_level="info",
+        # uvloop is not available on Windows
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        workers=settings.workers,
     )
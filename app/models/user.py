@@ -6,7 +6,7 @@ Copyright © 2025 Paksa IT Solutions (www.paksa.com.pk)
 """
 from datetime import datetime
 from typing import List, Optional
-from pydantic import BaseModel, EmailStr, Field, validator
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
 from enum import Enum
 
 class UserRole(str, Enum):
@@ -18,6 +18,8 @@ class UserRole(str, Enum):
 
 class UserBase(BaseModel):
     """Base user model with common fields"""
+    model_config = ConfigDict(from_attributes=True)
+    
     email: EmailStr
     username: str
     full_name: Optional[str] = None
@@ -28,15 +30,29 @@ class UserCreate(UserBase):
     """Model for creating a new user"""
     password: str = Field(..., min_length=8, max_length=100)
     
-    @validator('password')
+    @field_validator('password')
+    @classmethod
     def password_strength(cls, v):
         if len(v) < 8:
             raise ValueError('Password must be at least 8 characters long')
-        if not any(char.isdigit() for char in v):
+        
+        # Check all character classes in a single pass over the password
+        has_digit = has_upper = has_lower = False
+        for char in v:
+            if char.isdigit():
+                has_digit = True
+            elif char.isupper():
+                has_upper = True
+            elif char.islower():
+                has_lower = True
+            if has_digit and has_upper and has_lower:
+                break
+        
+        if not has_digit:
             raise ValueError('Password must contain at least one number')
-        if not any(char.isupper() for char in v):
+        if not has_upper:
             raise ValueError('Password must contain at least one uppercase letter')
-        if not any(char.islower() for char in v):
+        if not has_lower:
             raise ValueError('Password must contain at least one lowercase letter')
         return v
 
@@ -54,9 +70,6 @@ class UserInDB(UserBase):
     updated_at: datetime
     last_login: Optional[datetime] = None
 
-    class Config:
-        orm_mode = True
-
 class User(UserBase):
     """User model for API responses"""
     id: str
@@ -64,9 +77,6 @@ class User(UserBase):
     updated_at: datetime
     last_login: Optional[datetime] = None
 
-    class Config:
-        orm_mode = True
-
 class Token(BaseModel):
     """Authentication token model"""
     access_token: str
@@ -7,16 +7,20 @@ Copyright © 2025 Paksa IT Solutions (www.paksa.com.pk)
 from datetime import datetime, timedelta
 from typing import Optional
 import os
+import threading
+import time
+from cachetools import TTLCache
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 # Security constants
 SECRET_KEY = os.getenv("SECRET_KEY", "your-secret-key-here")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
+TOKEN_CACHE_TTL_SECONDS = 60
 
 # Password hashing
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -30,6 +34,9 @@ class TokenData(BaseModel):
     username: Optional[str] = None
 
 class User(BaseModel):
+    # Frozen so instances can be shared across requests via the token cache
+    model_config = ConfigDict(frozen=True)
+    
     username: str
     email: Optional[str] = None
     full_name: Optional[str] = None
@@ -38,6 +45,10 @@ class User(BaseModel):
 class UserInDB(User):
     hashed_password: str
 
+# Cache of decoded tokens: token -> (user, token expiry timestamp)
+_token_cache = TTLCache(maxsize=10_000, ttl=TOKEN_CACHE_TTL_SECONDS)
+_token_cache_lock = threading.Lock()
+
 # Mock database
 fake_users_db = {
     "admin": {
@@ -86,6 +97,13 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
 
 async def get_current_user(token: str = Depends(oauth2_scheme)):
     """Get the current user from the token"""
+    with _token_cache_lock:
+        cached = _token_cache.get(token)
+    if cached is not None:
+        user, expires_at = cached
+        if time.time() < expires_at:
+            return user
+    
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -97,13 +115,24 @@ async def get_current_user(token: str = Depends(oauth2_scheme)):
         if username is None:
             raise credentials_exception
         token_data = TokenData(username=username)
+        expires_at = payload.get("exp")
     except JWTError:
         raise credentials_exception
     user = get_user(fake_users_db, username=token_data.username)
     if user is None:
         raise credentials_exception
+    
+    # Never serve a cached user past the token's own expiry
+    if expires_at is not None:
+        with _token_cache_lock:
+            _token_cache[token] = (user, expires_at)
     return user
 
+def invalidate_cached_token(token: str) -> None:
+    """Remove a token from the decoded token cache (e.g. on logout)"""
+    with _token_cache_lock:
+        _token_cache.pop(token, None)
+
 async def get_current_active_user(current_user: User = Depends(get_current_user)):
     """Get the current active user"""
     if current_user.disabled: